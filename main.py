@@ -2,7 +2,6 @@
 Mod Side Checker - Main entry point.
 Analyzes Minecraft mods to determine if they are client-side or server-side.
 """
-import signal
 import sys
 import os
 
@@ -24,10 +23,13 @@ from src.config_manager import ConfigManager
 class Application:
     """Main application class."""
     
+    __slots__ = ('checker', 'modpack_creator')
+    
     def __init__(self):
         """Initialize the application."""
         self.checker = ModChecker()
-        self.modpack_creator = ModpackCreator()
+        # Share the checker so both modes use one environment cache
+        self.modpack_creator = ModpackCreator(self.checker)
     
     def run_mod_checker(self):
         """Run the mod side checker functionality."""
@@ -58,25 +60,7 @@ class Application:
                 UserInterface.print_summary(mods_df)
                 
                 # Export options
-                while True:
-                    choice = UserInterface.get_export_choice()
-                    
-                    if choice == '1':
-                        FileManager.save_filtered_list(mods_df, "all")
-                    elif choice == '2':
-                        FileManager.save_filtered_list(mods_df, "client")
-                    elif choice == '3':
-                        FileManager.save_filtered_list(mods_df, "server")
-                    elif choice == '4':
-                        FileManager.save_filtered_list(mods_df, "both")
-                    elif choice == '5':
-                        FileManager.save_filtered_list(mods_df, "all")
-                        FileManager.save_filtered_list(mods_df, "client")
-                        FileManager.save_filtered_list(mods_df, "server")
-                        FileManager.save_filtered_list(mods_df, "both")
-                    elif choice == '6':
-                        ColorPrinter.print("\nReturning to main menu...", Fore.GREEN)
-                        break
+                UserInterface.handle_export(mods_df)
             else:
                 ColorPrinter.print("No mod data found to process or operation was interrupted.", Fore.YELLOW)
         
@@ -128,19 +112,21 @@ class Application:
                 
                 # Ask if the user wants to exit
                 ColorPrinter.print("Return to the main menu? (y/n): ", Fore.CYAN, end='')
-                if input().lower() != 'y':
+                if ColorPrinter.input().lower() != 'y':
                     ColorPrinter.print("Goodbye!", Fore.GREEN)
                     break
         
         except Exception as e:
             ColorPrinter.print(f"Error: {e}", Fore.RED)
-            SignalHandler.clean_exit()
+            # Not an interrupt: leave through sys.exit so buffered output is flushed
+            sys.stdout.flush()
+            sys.exit(1)
 
 
 def main():
     """Main entry point."""
     # Load configuration at startup
-    config = ConfigManager.load_config()
+    ConfigManager.load_config()
     
     # Set up signal handler for clean exit
     SignalHandler.setup_signal_handling()
@@ -2,39 +2,142 @@
 Core functionality for checking mod environments.
 """
 import os
-import time
+import re
+import json
 import signal
-import sys
-import threading
-import requests
-import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock, Event
-from tqdm import tqdm
+from threading import Event
 from colorama import Fore, Style
 
-# Try relative import first, fall back to absolute import if needed
+from .utils import ColorPrinter, TokenBucket
+from .config_manager import ConfigManager
+from .env_cache import EnvironmentCache
+
+# orjson is optional; when installed it decodes API responses faster than json
 try:
-    from .utils import ColorPrinter
-    from .config_manager import ConfigManager
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    import sys
-    import os.path
-    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-    from src.utils import ColorPrinter
-    from src.config_manager import ConfigManager
+    _json_loads = json.loads
+
+
+# Modrinth CDN URLs look like https://cdn.modrinth.com/data/{project_id}/versions/...
+_PROJECT_ID_RE = re.compile(r"/data/([^/]+)/")
+
+# (client_side, server_side) → side category; other pairs are reported verbatim
+_SIDE_MAP = {
+    ('required', 'required'): 'Both',
+    ('required', 'optional'): 'Client',
+    ('required', 'unsupported'): 'Client',
+    ('required', 'unknown'): 'Client',
+    ('optional', 'required'): 'Server',
+    ('unsupported', 'required'): 'Server',
+    ('unknown', 'required'): 'Server',
+    ('optional', 'optional'): 'Optional',
+}
+
+# Index paths whose folder alone decides the side, so no API lookup is needed
+_CLIENT_PATH_PREFIXES = ('resourcepacks/', 'shaderpacks/', 'client-overrides/')
+_SERVER_PATH_PREFIXES = ('server-overrides/',)
+
+
+def _format_bar(progress):
+    """
+    Build the progress bar format for a completion percentage.
+    
+    Args:
+        progress (float): Progress percentage (0.0 to 1.0).
+        
+    Returns:
+        str: tqdm bar format colored along a red → yellow → green gradient
+    """
+    if progress < 0.5:
+        # Red to yellow gradient (increase green)
+        r = 255
+        g = int(255 * progress * 2)  # 0 to 255 as progress goes 0 to 0.5
+    else:
+        # Yellow to green gradient (decrease red)
+        r = int(255 * (1 - progress) * 2)  # 255 to 0 as progress goes 0.5 to 1
+        g = 255
+    
+    color_code = f"\033[38;2;{r};{g};0m"
+    return f"{color_code}  {{desc}}: |{{bar}}| {{percentage:3.0f}}%{Style.RESET_ALL}"
+
+
+# One precomputed bar format per integer percent, indexed on every progress update
+_BAR_FORMATS = [_format_bar(percent / 100) for percent in range(101)]
 
 
 class ModChecker:
     """Class for checking mod environment requirements."""
     
+    __slots__ = ('mods_data', 'data', 'stop_event', '_session', 'cache', 'limiter', '_original_sigint')
+    
+    PROJECTS_API_URL = "https://api.modrinth.com/v2/projects"
+    MAX_RATE_LIMIT_WAITS = 5  # Waits on 429 before giving up on a chunk
+    RATE_LIMIT_LOW_WATERMARK = 10  # Pause all requests when fewer remain in the window
+    INTERRUPT_MESSAGE = b"\nKeyboard interrupt detected. Stopping processing...\n"
+    
     def __init__(self):
         """Initialize the ModChecker."""
         self.mods_data = []
         self.data = None
-        self.progress_lock = Lock()
-        self.processed_mods = set()  # Track processed mods to avoid duplicates
         self.stop_event = Event()  # Event to signal threads to stop
+        self._original_sigint = signal.getsignal(signal.SIGINT)
+        self._session = None  # Created on first use so startup does not import requests
+        self.cache = EnvironmentCache()
+        # Shared by all worker threads to stay under Modrinth's 300 requests/minute
+        self.limiter = TokenBucket(
+            ConfigManager.get('api', 'requests_per_second', default=4.5),
+            ConfigManager.get('api', 'burst', default=10)
+        )
+    
+    @property
+    def session(self):
+        """
+        Get the pooled HTTP session, creating it on first use.
+        
+        Returns:
+            requests.Session: Session for Modrinth API requests
+        """
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+    
+    @staticmethod
+    def _create_session():
+        """
+        Create a pooled HTTP session for Modrinth API requests.
+        
+        Returns:
+            requests.Session: Session with keep-alive pooling and retries
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": ConfigManager.get('api', 'user_agent', default="ModEnvironmentChecker/1.0"),
+            "Accept": "application/json"
+        })
+        class _Retry(Retry):
+            # urllib3 retries any of these that carry Retry-After, whatever status_forcelist says.
+            # Leave 429 to fetch_environment_chunk, whose wait can be interrupted.
+            RETRY_AFTER_STATUS_CODES = frozenset({503})
+        
+        # Retry transient failures, waiting as long as Modrinth asks on 503
+        retries = _Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # At most one connection per worker thread is ever in use
+        pool_size = ConfigManager.get('threading', 'max_threads', default=10)
+        session.mount("https://", HTTPAdapter(pool_maxsize=pool_size, max_retries=retries))
+        return session
     
     def set_data(self, data):
         """
@@ -45,107 +148,205 @@ class ModChecker:
         """
         self.data = data
     
-    def get_mod_environment(self, download_url):
+    @staticmethod
+    def get_project_id(download_url):
         """
-        Get mod environment requirements from Modrinth API.
+        Extract the Modrinth project ID from a CDN download URL.
         
         Args:
             download_url (str): Download URL for the mod.
             
         Returns:
-            str: Environment type (Client, Server, Both, Optional, Unknown)
+            str: Project ID or None if the URL has no project segment
         """
-        try:
-            # Check if we should stop processing
-            if self.stop_event.is_set():
-                return "Unknown"
-                
-            parts = download_url.split('/')
-            project_id = next((parts[i + 1] for i, part in enumerate(parts) if part == 'data'), None)
+        match = _PROJECT_ID_RE.search(download_url)
+        return match.group(1) if match else None
+    
+    @staticmethod
+    def get_path_side(path):
+        """
+        Get the side a file belongs to from its folder in the index, if decisive.
+        
+        Args:
+            path (str): Path of the file inside the modpack.
             
-            if not project_id:
-                return "Unknown"
+        Returns:
+            str: 'Client' or 'Server', or None if the API must be consulted
+        """
+        if path.startswith(_CLIENT_PATH_PREFIXES):
+            return "Client"
+        if path.startswith(_SERVER_PATH_PREFIXES):
+            return "Server"
+        return None
+    
+    def fetch_environment_chunk(self, chunk):
+        """
+        Fetch environment requirements for one chunk of project IDs.
+        
+        Args:
+            chunk (list): Modrinth project IDs to look up in a single request.
+            
+        Returns:
+            dict: Mapping of project ID to (client_side, server_side)
+        """
+        env_map = {}
+        
+        # Check if we should stop processing
+        if self.stop_event.is_set():
+            return env_map
+        
+        try:
+            params = {"ids": json.dumps(chunk)}
+            if not self.limiter.acquire(self.stop_event):
+                return env_map
+            response = self.session.get(self.PROJECTS_API_URL, params=params, timeout=30)
             
-            headers = {
-                "User-Agent": ConfigManager.get('api', 'user_agent', default="ModEnvironmentChecker/1.0"),
-                "Accept": "application/json"
-            }
-            api_url = f"https://api.modrinth.com/v2/project/{project_id}"
-            response = requests.get(api_url, headers=headers)
+            # Rate limited, so wait as instructed unless interrupted meanwhile
+            rate_limit_waits = 0
+            while (response.status_code == 429 and rate_limit_waits < self.MAX_RATE_LIMIT_WAITS
+                   and not self.stop_event.is_set()):
+                wait = self._get_retry_after(response)
+                ColorPrinter.print(f"Rate limited by Modrinth, retrying in {wait}s...", Fore.YELLOW)
+                if self.stop_event.wait(wait):
+                    return env_map
+                rate_limit_waits += 1
+                if not self.limiter.acquire(self.stop_event):
+                    return env_map
+                response = self.session.get(self.PROJECTS_API_URL, params=params, timeout=30)
             
-            # Use request delay from config
-            time.sleep(ConfigManager.get('api', 'request_delay', default=0.5))
+            # Nearly out of requests for this window, so hold every thread until it resets
+            remaining = response.headers.get('X-Ratelimit-Remaining', '')
+            if remaining.isdigit() and int(remaining) < self.RATE_LIMIT_LOW_WATERMARK:
+                self.limiter.pause(self._get_retry_after(response))
             
-            if response.status_code == 200:
-                project_data = response.json()
-                client_side = project_data.get('client_side', 'unknown')
-                server_side = project_data.get('server_side', 'unknown')
-                
-                if client_side == "required" and server_side == "required":
-                    return "Both"
-                elif client_side == "required":
-                    return "Client"
-                elif server_side == "required":
-                    return "Server"
-                elif client_side == "optional" and server_side == "optional":
-                    return "Optional"
-                else:
-                    return f"Client: {client_side}, Server: {server_side}"
+            if response.status_code != 200:
+                ColorPrinter.print(f"Modrinth API returned {response.status_code} for {len(chunk)} projects", Fore.RED)
+                return env_map
             
-            return "Unknown"
+            for project_data in _json_loads(response.content):
+                env_map[project_data['id']] = (
+                    project_data.get('client_side', 'unknown'),
+                    project_data.get('server_side', 'unknown')
+                )
         except Exception as e:
-            ColorPrinter.print(f"Error fetching mod info for {download_url}: {e}", Fore.RED)
+            ColorPrinter.print(f"Error fetching mod info for {len(chunk)} projects: {e}", Fore.RED)
+        
+        return env_map
+    
+    @staticmethod
+    def _get_retry_after(response):
+        """
+        Get the number of seconds a rate-limited response asks us to wait.
+        
+        Args:
+            response (requests.Response): Response carrying rate limit headers.
+            
+        Returns:
+            int: Seconds to wait before retrying
+        """
+        # Modrinth also reports seconds until the window resets in X-Ratelimit-Reset
+        wait = response.headers.get('Retry-After', response.headers.get('X-Ratelimit-Reset', '1'))
+        try:
+            return max(1, int(wait))
+        except ValueError:
+            return 1
+    
+    def fetch_environments_bulk(self, project_ids, max_threads=1):
+        """
+        Fetch environment requirements for many projects with the bulk endpoint.
+        
+        Chunks are requested concurrently so large packs are not limited by
+        the round trip of a single request.
+        
+        Args:
+            project_ids (list): Modrinth project IDs to look up.
+            max_threads (int): Maximum number of chunks in flight at once.
+            
+        Returns:
+            dict: Mapping of project ID to (client_side, server_side)
+        """
+        chunk_size = ConfigManager.get('api', 'bulk_chunk_size', default=100)
+        chunks = [
+            project_ids[i:i + chunk_size]
+            for i in range(0, len(project_ids), chunk_size)
+        ]
+        if not chunks:
+            return {}
+        
+        # Create the session here so worker threads never race to create it
+        self.session
+        
+        env_map = {}
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_threads, len(chunks))) as executor:
+                for chunk_map in executor.map(self.fetch_environment_chunk, chunks):
+                    env_map.update(chunk_map)
+        finally:
+            # Don't hold idle connections open while the user browses the menus
+            self._session.close()
+            self._session = None
+        
+        return env_map
+    
+    def get_mod_environment(self, project_id, env_map):
+        """
+        Get mod environment requirements from prefetched Modrinth data.
+        
+        Args:
+            project_id (str): Modrinth project ID of the mod, or None.
+            env_map (dict): Mapping of project ID to (client_side, server_side).
+            
+        Returns:
+            str: Environment type (Client, Server, Both, Optional, Unknown)
+        """
+        sides = env_map.get(project_id)
+        if sides is None:
             return "Unknown"
+        
+        client_side, server_side = sides
+        return _SIDE_MAP.get((client_side, server_side), f"Client: {client_side}, Server: {server_side}")
     
-    def process_mod_batch(self, mods_batch, thread_id, progress_bar):
+    def process_mod_batch(self, mods_batch, positions, columns, thread_id, progress_bar, env_map):
         """
         Process a batch of mods assigned to a specific thread.
         
+        Results are written straight into the shared result columns. Each
+        thread owns a disjoint set of rows, so no locking is needed.
+        
         Args:
-            mods_batch (list): List of mods to process.
+            mods_batch (list): (name, download_url, project_id, path_side) tuples to process.
+            positions (range): Result row of each mod in the batch.
+            columns (tuple): Preallocated (names, sides, urls) result lists.
             thread_id (int): Thread identifier.
             progress_bar (tqdm): Progress bar for this thread.
-            
-        Returns:
-            list: List of processed mod data.
+            env_map (dict): Mapping of project ID to (client_side, server_side).
         """
-        results = []
-        for mod in mods_batch:
+        names, sides, urls = columns
+        last_percent = 0  # Bars start at the 0% format
+        for position, (name, download_url, project_id, path_side) in zip(positions, mods_batch):
             # Check if we should stop processing
             if self.stop_event.is_set():
                 break
                 
             try:
-                path = mod.get('path', '')
-                name = os.path.basename(path) if path else "Unknown"
+                side = path_side or self.get_mod_environment(project_id, env_map)
                 
-                # Skip if already processed
-                if name in self.processed_mods:
-                    continue
+                # Each bar belongs to this thread only; tqdm locks its own output
+                progress_bar.update(1)
+                # Update color only when the whole percentage changes
+                percent = progress_bar.n * 100 // progress_bar.total
+                if percent != last_percent:
+                    progress_bar.bar_format = _BAR_FORMATS[percent]
+                    last_percent = percent
+                # Use fixed width for description to prevent size changes
+                progress_bar.set_description(f"Thread {thread_id:<2} {name[:20]:<20}")
                 
-                download_links = mod.get('downloads', [])
-                download_url = download_links[0] if download_links else ""
-                side = self.get_mod_environment(download_url)
-                
-                with self.progress_lock:
-                    self.processed_mods.add(name)
-                    progress_bar.update(1)
-                    # Update color based on progress
-                    progress = progress_bar.n / progress_bar.total
-                    self.update_progress_color(progress_bar, progress)
-                    # Use fixed width for description to prevent size changes
-                    progress_bar.set_description(f"Thread {thread_id:<2} {name[:20]:<20}")
-                
-                results.append({
-                    'Name': name,
-                    'Side': side,
-                    'Download URL': download_url
-                })
+                names[position] = name
+                sides[position] = side
+                urls[position] = download_url
                 
             except Exception as e:
                 ColorPrinter.print(f"Error processing mod {name}: {e}", Fore.RED)
-        
-        return results
     
     def update_progress_color(self, progress_bar, progress):
         """
@@ -155,26 +356,7 @@ class ModChecker:
             progress_bar (tqdm): Progress bar to update.
             progress (float): Progress percentage (0.0 to 1.0).
         """
-        # Calculate color: red (255,0,0) → yellow (255,255,0) → green (0,255,0)
-        if progress < 0.5:
-            # Red to yellow gradient (increase green)
-            r = 255
-            g = int(255 * progress * 2)  # 0 to 255 as progress goes 0 to 0.5
-            b = 0
-        else:
-            # Yellow to green gradient (decrease red)
-            r = int(255 * (1 - progress) * 2)  # 255 to 0 as progress goes 0.5 to 1
-            g = 255
-            b = 0
-            
-        # Format color code to ensure values are in valid range
-        r = max(0, min(255, r))
-        g = max(0, min(255, g))
-        b = max(0, min(255, b))
-        
-        # Set the color directly in the format string
-        color_code = f"\033[38;2;{r};{g};{b}m"
-        progress_bar.bar_format = f"{color_code}  {{desc}}: |{{bar}}| {{percentage:3.0f}}%{Style.RESET_ALL}"
+        progress_bar.bar_format = _BAR_FORMATS[int(progress * 100)]
     
     def process_mods(self, max_threads):
         """
@@ -189,23 +371,87 @@ class ModChecker:
         # Reset stop event
         self.stop_event.clear()
         
-        # We'll handle keyboard interrupts more directly at the executor level
-        # rather than with a separate monitoring thread
+        # Ctrl+C should stop the workers and keep partial results, not exit the app
+        self._original_sigint = signal.signal(signal.SIGINT, self._handle_interrupt)
+        try:
+            return self._process_mods(max_threads)
+        finally:
+            signal.signal(signal.SIGINT, self._original_sigint)
+    
+    def _handle_interrupt(self, sig, frame):
+        """
+        Signal all threads to stop at their next opportunity.
         
-        mods_list = self.data.get('files', [])
-        total_mods = len(mods_list)
+        Args:
+            sig: Signal number
+            frame: Current stack frame
+        """
+        self.stop_event.set()
+        # A second Ctrl+C goes to the previous handler, so a stuck run can still be exited
+        signal.signal(signal.SIGINT, self._original_sigint)
+        # Only async-signal-safe output here; print could re-enter a half-written stdout
+        os.write(2, self.INTERRUPT_MESSAGE)
+    
+    def _process_mods(self, max_threads):
+        """
+        Process mods once the interrupt handler is installed.
         
-        # Split mods into batches for each thread
-        batch_size = total_mods // max_threads
-        mod_batches = [
-            mods_list[i:i + batch_size] 
-            for i in range(0, total_mods, batch_size)
-        ]
+        Args:
+            max_threads (int): Number of threads to use.
+            
+        Returns:
+            DataFrame: Pandas DataFrame with processed mod data.
+        """
+        # Imported here so choosing a menu option does not pay for them at startup
+        import pandas as pd
+        from tqdm import tqdm
+        
+        # Extract each mod's name, URL and project ID once, keeping the first
+        # entry per file name so no thread ever sees a duplicate
+        mods_by_name = {}
+        for mod in self.data.get('files', []):
+            path = mod.get('path', '')
+            name = os.path.basename(path) if path else "Unknown"
+            if name not in mods_by_name:
+                download_links = mod.get('downloads', [])
+                download_url = download_links[0] if download_links else ""
+                mods_by_name[name] = (name, download_url, self.get_project_id(download_url), self.get_path_side(path))
+        mods_list = list(mods_by_name.values())
+        
+        path_classified = sum(1 for mod in mods_list if mod[3])
+        if path_classified:
+            ColorPrinter.print(f"Classified {path_classified} files by their folder", Fore.CYAN)
+        
+        # Collect every project ID up-front so Modrinth is queried in a few bulk requests
+        project_ids = {project_id for _, _, project_id, path_side in mods_list if project_id and not path_side}
         
-        # Adjust last batch to include remaining mods
-        if len(mod_batches) > max_threads:
-            mod_batches[-2].extend(mod_batches[-1])
-            mod_batches.pop()
+        # Only projects without a fresh cache entry need to hit the API
+        env_map = {}
+        uncached_ids = []
+        for project_id in sorted(project_ids):
+            cached = self.cache.get(project_id)
+            if cached:
+                env_map[project_id] = cached
+            else:
+                uncached_ids.append(project_id)
+        
+        ColorPrinter.print(
+            f"Fetching environment data for {len(uncached_ids)} projects ({len(env_map)} cached)...",
+            Fore.CYAN
+        )
+        fetched = self.fetch_environments_bulk(uncached_ids, max_threads)
+        for project_id, (client_side, server_side) in fetched.items():
+            self.cache.put(project_id, client_side, server_side)
+        env_map.update(fetched)
+        self.cache.save()
+        
+        # Deal mods out round-robin so slow responses spread evenly across threads
+        total_mods = len(mods_list)
+        mod_batches = [mods_list[i::max_threads] for i in range(min(max_threads, total_mods))]
+        batch_positions = [range(i, total_mods, max_threads) for i in range(len(mod_batches))]
+        
+        # Threads fill their own rows, so results keep the index order
+        names, sides, urls = [None] * total_mods, [None] * total_mods, [None] * total_mods
 
         # Get UI settings from config
         progress_bar_width = ConfigManager.get('ui', 'progress_bar_width', default=80)
@@ -230,18 +476,17 @@ class ModChecker:
             # Initialize with 0% progress color
             self.update_progress_color(progress_bars[-1], 0)
 
-        # Variable to track if we were truly interrupted
-        was_interrupted = False
-        
         try:
-            results = []
             with ThreadPoolExecutor(max_workers=max_threads) as executor:
                 future_to_batch = {
                     executor.submit(
                         self.process_mod_batch, 
                         batch, 
+                        batch_positions[i],
+                        (names, sides, urls),
                         i+1, 
-                        progress_bars[i]
+                        progress_bars[i],
+                        env_map
                     ): i 
                     for i, batch in enumerate(mod_batches)
                 }
@@ -249,15 +494,12 @@ class ModChecker:
                 # Wait for all tasks to complete
                 for future in as_completed(future_to_batch):
                     try:
-                        batch_results = future.result()
-                        results.extend(batch_results)
+                        future.result()
                     except Exception as e:
                         ColorPrinter.print(f"Error in thread: {e}", Fore.RED)
         except KeyboardInterrupt:
-            # This will catch actual keyboard interrupts
-            was_interrupted = True
-            ColorPrinter.print("\nKeyboard interrupt detected. Stopping processing...", Fore.YELLOW)
-            self.stop_event.set()  # Signal all threads to stop at next opportunity
+            # Only reached if another SIGINT handler raised instead of ours
+            self._handle_interrupt(signal.SIGINT, None)
             # Don't re-raise the exception, let the cleanup proceed
         finally:
             # Clean up
@@ -268,10 +510,17 @@ class ModChecker:
             print("\n" * (max_threads // 2 + 1))  # Reduced from (max_threads + 1)
             
             # Only show the interrupt message if it was actually interrupted by user
-            if was_interrupted:
+            if self.stop_event.is_set():
                 ColorPrinter.print("Stopped due to user interrupt. Partial results available.", Fore.YELLOW)
         
-        df = pd.DataFrame(results) if results else None
+        # Build the frame column-wise, dropping rows left empty by an interrupt or error
+        df = pd.DataFrame({'Name': names, 'Side': sides, 'Download URL': urls}, copy=False)
+        df = df.dropna(subset=['Name']).reset_index(drop=True)
+        if df.empty:
+            df = None
+        else:
+            # Few distinct sides, so a categorical makes filtering and grouping cheap
+            df['Side'] = df['Side'].astype('category')
         
         # If we have results, even partial ones, return them
         return df
@@ -2,18 +2,12 @@
 Configuration manager for the Mod Side Checker.
 """
 import os
+import copy
 import json
 from pathlib import Path
 
-# Try relative import first, fall back to absolute import if needed
-try:
-    from .utils import ColorPrinter
-except ImportError:
-    import sys
-    import os.path
-    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-    from src.utils import ColorPrinter
-    
+from .utils import ColorPrinter
+
 from colorama import Fore
 
 class ConfigManager:
@@ -31,13 +25,23 @@ class ConfigManager:
             "warning": "Using more than 6 threads may cause UI stability issues depending on your system"
         },
         "api": {
-            "request_delay": 0.5,
-            "user_agent": "ModEnvironmentChecker/1.0"
+            "requests_per_second": 4.5,
+            "burst": 10,
+            "user_agent": "ModEnvironmentChecker/1.0",
+            "bulk_chunk_size": 100
+        },
+        "cache": {
+            "enabled": True,
+            "file": "modrinth_cache.json",
+            "ttl_days": 7
         },
         "ui": {
             "progress_bar_width": 80,
             "use_ascii_bars": True
         },
+        "export": {
+            "default_format": "csv"
+        },
         "files": {
             "mod_index": "modrinth.index.json",
             "server_pack": "server_pack.zip",
@@ -47,6 +51,7 @@ class ConfigManager:
     
     _config = None
     _config_path = None
+    _flat = None  # Key path tuple → value, so get() is a single dict lookup
     
     @classmethod
     def get_config_path(cls):
@@ -76,21 +81,23 @@ class ConfigManager:
         if not os.path.exists(config_path):
             ColorPrinter.print("No configuration file found. Creating default config.json...", Fore.YELLOW)
             cls.save_config(cls.DEFAULT_CONFIG)
-            return cls.DEFAULT_CONFIG
+            cls._set_config(cls.DEFAULT_CONFIG)
+            return cls._config
         
         # Load existing config
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
                 # Merge with defaults to ensure all keys exist
-                merged_config = cls.DEFAULT_CONFIG.copy()
+                merged_config = copy.deepcopy(cls.DEFAULT_CONFIG)
                 cls._deep_update(merged_config, config)
-                cls._config = merged_config
+                cls._set_config(merged_config)
                 return cls._config
         except Exception as e:
             ColorPrinter.print(f"Error loading config: {e}", Fore.RED)
             ColorPrinter.print("Using default configuration.", Fore.YELLOW)
-            return cls.DEFAULT_CONFIG
+            cls._set_config(cls.DEFAULT_CONFIG)
+            return cls._config
     
     @classmethod
     def save_config(cls, config):
@@ -104,7 +111,7 @@ class ConfigManager:
         try:
             with open(config_path, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2)
-            cls._config = config
+            cls._set_config(config)
             ColorPrinter.print(f"Configuration saved to {config_path}", Fore.GREEN)
         except Exception as e:
             ColorPrinter.print(f"Error saving config: {e}", Fore.RED)
@@ -124,16 +131,37 @@ class ConfigManager:
         Example:
             get('folders', 'input') -> returns input folder path
         """
-        if cls._config is None:
+        if cls._flat is None:
             cls.load_config()
-            
-        config = cls._config
-        try:
-            for key in keys:
-                config = config[key]
-            return config
-        except (KeyError, TypeError):
-            return default
+        
+        return cls._flat.get(keys, default)
+    
+    @classmethod
+    def _set_config(cls, config):
+        """
+        Set the active configuration and rebuild the flat key map.
+        
+        Args:
+            config (dict): Configuration to use
+        """
+        cls._config = config
+        cls._flat = {(): config}
+        cls._flatten(config, ())
+    
+    @classmethod
+    def _flatten(cls, section, prefix):
+        """
+        Record every value in a section under its full key path.
+        
+        Args:
+            section (dict): Configuration section to walk
+            prefix (tuple): Key path of the section
+        """
+        for key, value in section.items():
+            path = prefix + (key,)
+            cls._flat[path] = value
+            if isinstance(value, dict):
+                cls._flatten(value, path)
     
     @classmethod
     def _deep_update(cls, target, source):
@@ -0,0 +1,85 @@
+"""
+Persistent cache of Modrinth environment data for the Mod Side Checker.
+"""
+import os
+import json
+import time
+from colorama import Fore
+
+from .utils import ColorPrinter
+from .config_manager import ConfigManager
+
+
+class EnvironmentCache:
+    """Class for caching project environment requirements between runs."""
+    
+    def __init__(self):
+        """Initialize the cache from the configured cache file."""
+        self.enabled = ConfigManager.get('cache', 'enabled', default=True)
+        self.ttl_seconds = ConfigManager.get('cache', 'ttl_days', default=7) * 86400
+        self.path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            ConfigManager.get('cache', 'file', default="modrinth_cache.json")
+        )
+        self._entries = self._load() if self.enabled else {}
+        self._dirty = False
+    
+    def _load(self):
+        """
+        Load cached entries from disk.
+        
+        Returns:
+            dict: Mapping of project ID to [client_side, server_side, fetched_at]
+        """
+        if not os.path.exists(self.path):
+            return {}
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            ColorPrinter.print(f"Error loading cache, starting fresh: {e}", Fore.YELLOW)
+            return {}
+    
+    def get(self, project_id):
+        """
+        Get cached environment requirements for a project.
+        
+        Args:
+            project_id (str): Modrinth project ID
+        
+        Returns:
+            tuple: (client_side, server_side) or None if missing or expired
+        """
+        entry = self._entries.get(project_id)
+        if entry is None or time.time() - entry[2] > self.ttl_seconds:
+            return None
+        return entry[0], entry[1]
+    
+    def put(self, project_id, client_side, server_side):
+        """
+        Store environment requirements for a project.
+        
+        Args:
+            project_id (str): Modrinth project ID
+            client_side (str): Client-side requirement
+            server_side (str): Server-side requirement
+        """
+        if self.enabled:
+            self._entries[project_id] = [client_side, server_side, int(time.time())]
+            self._dirty = True
+    
+    def save(self):
+        """Write the cache to disk if it changed since it was loaded or saved."""
+        if not self.enabled or not self._dirty:
+            return
+        
+        # Write to a sibling file and swap it in so an interrupted save never truncates the cache
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            ColorPrinter.print(f"Error saving cache: {e}", Fore.RED)
@@ -2,30 +2,60 @@
 File operations for the Mod Side Checker.
 """
 import os
+import io
 import json
+import bisect
 import shutil
 import zipfile
 import tempfile
+import threading
 import time
+from importlib.util import find_spec
 from colorama import Fore
 
-# Try relative import first, fall back to absolute import if needed
+from .utils import ColorPrinter
+from .config_manager import ConfigManager
+
+# ijson is optional; when installed the index is streamed instead of loaded whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson is optional; when installed it parses the index faster than json
 try:
-    from .utils import ColorPrinter
+    import orjson
 except ImportError:
-    import sys
-    import os.path
-    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-    from src.utils import ColorPrinter
+    orjson = None
+
+# Resolved once at import; every folder below hangs off it
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 class FileManager:
     """Class for managing file operations."""
     
     # Define folder paths
-    INPUT_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), "input")
-    OUTPUT_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
-    TEMP_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), "temp")
+    INPUT_FOLDER = os.path.join(_PROJECT_ROOT, "input")
+    OUTPUT_FOLDER = os.path.join(_PROJECT_ROOT, "output")
+    TEMP_FOLDER = os.path.join(_PROJECT_ROOT, "temp")
+    
+    # Filter type → (exact Side value, or None for every mod; export file name)
+    EXPORT_LISTS = {
+        "all": (None, "Lista_Mods_Com_Ambiente.csv"),
+        "client": ("Client", "Lista_Mods_Client.csv"),
+        "server": ("Server", "Lista_Mods_Server.csv"),
+        "both": ("Both", "Lista_Mods_Both.csv"),
+    }
+    
+    # Indexes smaller than this parse faster in one go than through ijson
+    STREAM_INDEX_MIN_BYTES = 2 * 1024 * 1024
+    
+    # A bundled mods.zip up to this size is read into memory rather than copied to disk
+    MODS_ZIP_IN_MEMORY_MAX_BYTES = 512 * 1024 * 1024
+    
+    # .mrpack file found by the last load_mod_data call, so callers don't search again
+    mrpack_path = None
     
     @classmethod
     def ensure_folders_exist(cls):
@@ -38,17 +68,54 @@ class FileManager:
     @classmethod
     def clean_temp_folder(cls):
         """Clean up temporary folder."""
-        if os.path.exists(cls.TEMP_FOLDER):
-            shutil.rmtree(cls.TEMP_FOLDER)
-            os.makedirs(cls.TEMP_FOLDER, exist_ok=True)
+        if not os.path.exists(cls.TEMP_FOLDER):
+            return
+        
+        # Move the old contents aside in one rename and delete them in the background,
+        # so the next extraction doesn't wait on unlinking every jar
+        stale_folder = f"{cls.TEMP_FOLDER}.old.{os.getpid()}.{time.time_ns()}"
+        try:
+            os.rename(cls.TEMP_FOLDER, stale_folder)
+        except OSError:
+            # Something still holds a file open (common on Windows); empty the folder in place
+            with os.scandir(cls.TEMP_FOLDER) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+            return
+        
+        os.makedirs(cls.TEMP_FOLDER, exist_ok=True)
+        
+        # Also pick up folders left behind when an earlier run exited before its cleanup finished
+        stale_prefix = f"{os.path.basename(cls.TEMP_FOLDER)}.old."
+        with os.scandir(os.path.dirname(cls.TEMP_FOLDER)) as entries:
+            stale_folders = [entry.path for entry in entries if entry.name.startswith(stale_prefix)]
+        threading.Thread(target=cls._remove_folders, args=(stale_folders,), name="temp-cleanup").start()
+    
+    @staticmethod
+    def _remove_folders(folders):
+        """
+        Delete folders, ignoring any that are already gone or can't be removed.
+        
+        Args:
+            folders (list): Paths of the folders to delete
+        """
+        for folder in folders:
+            shutil.rmtree(folder, ignore_errors=True)
     
     @classmethod
-    def extract_mrpack(cls, mrpack_file):
+    def extract_mrpack(cls, mrpack_file, json_path):
         """
-        Extract a .mrpack file to the temp folder.
+        Extract modrinth.index.json from a .mrpack file.
+        
+        Only the index is read; mod files are extracted later by extract_mods
+        when a modpack is actually being built.
         
         Args:
             mrpack_file (str): Path to the .mrpack file
+            json_path (str): Where to write the extracted modrinth.index.json
             
         Returns:
             str: Path to the extracted modrinth.index.json file
@@ -56,64 +123,14 @@ class FileManager:
         cls.clean_temp_folder()
         
         try:
-            # Extract the .mrpack file (it's a zip file)
+            # The .mrpack file is a zip file
             with zipfile.ZipFile(mrpack_file, 'r') as zip_ref:
-                zip_ref.extractall(cls.TEMP_FOLDER)
-            
-            # Path to the extracted modrinth.index.json
-            json_path = os.path.join(cls.TEMP_FOLDER, 'modrinth.index.json')
-            
-            if not os.path.exists(json_path):
-                ColorPrinter.print(f"modrinth.index.json not found in the .mrpack file!", Fore.RED)
-                return None
-            
-            # Look for mods.zip in the overrides folder
-            overrides_dir = os.path.join(cls.TEMP_FOLDER, 'overrides')
-            if os.path.exists(overrides_dir):
-                mods_zip = os.path.join(overrides_dir, 'mods.zip')
-                mods_dir = os.path.join(cls.TEMP_FOLDER, 'mods')  # Use a direct mods folder for easier access
-                
-                # Create mods directory if it doesn't exist
-                os.makedirs(mods_dir, exist_ok=True)
+                if 'modrinth.index.json' not in zip_ref.namelist():
+                    ColorPrinter.print(f"modrinth.index.json not found in the .mrpack file!", Fore.RED)
+                    return None
                 
-                # Check if mods.zip exists and extract it
-                if os.path.exists(mods_zip):
-                    ColorPrinter.print(f"Found mods.zip, extracting mod files...", Fore.GREEN)
-                    try:
-                        with zipfile.ZipFile(mods_zip, 'r') as zip_ref:
-                            # Extract all files from mods.zip
-                            for zip_info in zip_ref.infolist():
-                                # Extract to root mods directory regardless of internal structure
-                                if zip_info.filename.endswith('.jar'):
-                                    # Get just the filename part (remove paths)
-                                    jar_name = os.path.basename(zip_info.filename)
-                                    
-                                    # Extract to our mods directory
-                                    source = zip_ref.open(zip_info)
-                                    target = open(os.path.join(mods_dir, jar_name), "wb")
-                                    with source, target:
-                                        shutil.copyfileobj(source, target)
-                                    
-                        mod_count = len([f for f in os.listdir(mods_dir) if f.endswith('.jar')])
-                        ColorPrinter.print(f"✓ Extracted {mod_count} mod files", Fore.GREEN)
-                    except Exception as e:
-                        ColorPrinter.print(f"Error extracting mods.zip: {e}", Fore.RED)
-                else:
-                    # Check if there's already a mods folder with jars
-                    mods_in_overrides = os.path.join(overrides_dir, 'mods')
-                    if os.path.exists(mods_in_overrides):
-                        # Copy all jar files from the overrides/mods to our mods directory
-                        jar_count = 0
-                        for file in os.listdir(mods_in_overrides):
-                            if file.endswith('.jar'):
-                                shutil.copy2(
-                                    os.path.join(mods_in_overrides, file),
-                                    os.path.join(mods_dir, file)
-                                )
-                                jar_count += 1
-                        
-                        if jar_count > 0:
-                            ColorPrinter.print(f"✓ Found and copied {jar_count} mod files from overrides/mods", Fore.GREEN)
+                with zip_ref.open('modrinth.index.json') as source, open(json_path, 'wb') as target:
+                    shutil.copyfileobj(source, target)
             
             return json_path
         
@@ -121,6 +138,106 @@ class FileManager:
             ColorPrinter.print(f"Error extracting .mrpack file: {e}", Fore.RED)
             return None
     
+    @classmethod
+    def extract_mods(cls, mrpack_file):
+        """
+        Extract the mod files bundled in a .mrpack file's overrides to the temp folder.
+        
+        Does nothing if the mods were already extracted since the last clean.
+        
+        Args:
+            mrpack_file (str): Path to the .mrpack file
+            
+        Returns:
+            str: Path to the folder holding the extracted mod files
+        """
+        mods_dir = os.path.join(cls.TEMP_FOLDER, 'mods')  # Use a direct mods folder for easier access
+        if os.path.isdir(mods_dir):
+            return mods_dir
+        
+        # Create mods directory so a pack without bundled mods is only checked once
+        os.makedirs(mods_dir, exist_ok=True)
+        
+        # Joined onto every jar name below, so build it once
+        mods_prefix = mods_dir + os.sep
+        jar_count = 0
+        try:
+            # Route each member in one pass, reading nothing the pack doesn't need
+            with zipfile.ZipFile(mrpack_file, 'r') as pack_ref:
+                for pack_info in pack_ref.infolist():
+                    file = pack_info.filename
+                    if file == 'overrides/mods.zip':
+                        ColorPrinter.print(f"Found mods.zip, extracting mod files...", Fore.GREEN)
+                        try:
+                            # Open mods.zip from memory instead of landing it in the temp folder first
+                            if pack_info.file_size < cls.MODS_ZIP_IN_MEMORY_MAX_BYTES:
+                                mods_zip = io.BytesIO(pack_ref.read(pack_info))
+                            else:
+                                # Too big to hold in RAM; copy it straight to an anonymous temporary file
+                                mods_zip = tempfile.TemporaryFile()
+                                with pack_ref.open(pack_info) as source:
+                                    shutil.copyfileobj(source, mods_zip, 1024 * 1024)
+                                mods_zip.seek(0)
+                            
+                            with mods_zip, zipfile.ZipFile(mods_zip, 'r') as zip_ref:
+                                for zip_info in zip_ref.infolist():
+                                    # Extract to root mods directory regardless of internal structure
+                                    if zip_info.filename.endswith('.jar') and cls._extract_jar(zip_ref, zip_info, mods_prefix):
+                                        jar_count += 1
+                        except Exception as e:
+                            ColorPrinter.print(f"Error extracting mods.zip: {e}", Fore.RED)
+                    elif file.startswith('overrides/mods/') and file.endswith('.jar'):
+                        if cls._extract_jar(pack_ref, pack_info, mods_prefix):
+                            jar_count += 1
+        
+        except Exception as e:
+            ColorPrinter.print(f"Error extracting mod files from .mrpack file: {e}", Fore.RED)
+        
+        if jar_count > 0:
+            ColorPrinter.print(f"✓ Extracted {jar_count} mod files", Fore.GREEN)
+        
+        return mods_dir
+    
+    @staticmethod
+    def _extract_jar(zip_ref, zip_info, mods_prefix):
+        """
+        Extract one jar from a zip file into the mods folder, dropping its internal path.
+        
+        Args:
+            zip_ref (ZipFile): Open zip file holding the jar
+            zip_info (ZipInfo): Entry of the jar to extract
+            mods_prefix (str): Folder to extract the jar into, ending in a path separator
+            
+        Returns:
+            bool: True if the jar was extracted, False if it was empty and skipped
+        """
+        # An empty jar can't be a mod, so don't create a file for it
+        if zip_info.file_size == 0:
+            return False
+        
+        # Get just the filename part (remove paths)
+        jar_name = os.path.basename(zip_info.filename)
+        
+        # Size the copy buffer to the jar so small jars take a single read and write
+        with zip_ref.open(zip_info) as source, open(mods_prefix + jar_name, "wb") as target:
+            shutil.copyfileobj(source, target, min(zip_info.file_size, 1024 * 1024))
+        return True
+    
+    @classmethod
+    def list_jars(cls):
+        """
+        List the jar files extracted to the temp mods folder.
+        
+        Returns:
+            list: Jar file names, empty if nothing was extracted
+        """
+        mods_dir = os.path.join(cls.TEMP_FOLDER, 'mods')
+        if not os.path.isdir(mods_dir):
+            return []
+        
+        with os.scandir(mods_dir) as entries:
+            return [entry.name for entry in entries if entry.name.endswith('.jar') and entry.is_file()]
+    
     @classmethod
     def find_mrpack_file(cls):
         """
@@ -136,7 +253,7 @@ class FileManager:
                 return os.path.join(cls.INPUT_FOLDER, filename)
         
         ColorPrinter.print("No .mrpack file found in the input folder!", Fore.RED)
-        ColorPrinter.print(f"Please place a .mrpack file in: {os.path.abspath(cls.INPUT_FOLDER)}", Fore.YELLOW)
+        ColorPrinter.print(f"Please place a .mrpack file in: {cls.INPUT_FOLDER}", Fore.YELLOW)
         return None
     
     @classmethod
@@ -144,6 +261,8 @@ class FileManager:
         """
         Load mod data from the JSON file in input folder.
         
+        The .mrpack file it extracted from, or None, is kept in mrpack_path.
+        
         Args:
             filename (str): Name of the JSON file.
             
@@ -154,76 +273,154 @@ class FileManager:
         cls.ensure_folders_exist()
         
         # Print folder paths only once at the beginning of the process
-        ColorPrinter.print(f"Input folder: {os.path.abspath(cls.INPUT_FOLDER)}", Fore.CYAN)
-        ColorPrinter.print(f"Output folder: {os.path.abspath(cls.OUTPUT_FOLDER)}", Fore.CYAN)
+        ColorPrinter.print(f"Input folder: {cls.INPUT_FOLDER}", Fore.CYAN)
+        ColorPrinter.print(f"Output folder: {cls.OUTPUT_FOLDER}", Fore.CYAN)
         
         # First, check if we have a .mrpack file and try to extract it
-        mrpack_path = cls.find_mrpack_file()
+        mrpack_path = cls.mrpack_path = cls.find_mrpack_file()
         if mrpack_path:
             ColorPrinter.print(f"Found .mrpack file: {os.path.basename(mrpack_path)}", Fore.GREEN)
-            json_path = cls.extract_mrpack(mrpack_path)
-            if json_path:
+            # Write straight to the input folder so it's kept for future use
+            if cls.extract_mrpack(mrpack_path, os.path.join(cls.INPUT_FOLDER, filename)):
                 ColorPrinter.print(f"Extracted modrinth.index.json from .mrpack", Fore.GREEN)
-                # Copy the file to the input folder for future use
-                shutil.copy(json_path, os.path.join(cls.INPUT_FOLDER, filename))
         
         # Look for the file in input folder
         json_path = os.path.join(cls.INPUT_FOLDER, filename)
         
         if not os.path.exists(json_path):
             ColorPrinter.print(f"File {filename} not found in input folder!", Fore.RED)
-            ColorPrinter.print(f"Please place your {filename} file in: {os.path.abspath(cls.INPUT_FOLDER)}", Fore.YELLOW)
+            ColorPrinter.print(f"Please place your {filename} file in: {cls.INPUT_FOLDER}", Fore.YELLOW)
             return None, 0
         
-        with open(json_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
+        if ijson is not None and os.path.getsize(json_path) > cls.STREAM_INDEX_MIN_BYTES:
+            # Only the files array is used, so build just that one entry at a time
+            with open(json_path, 'rb') as file:
+                data = {'files': list(ijson.items(file, 'files.item', use_float=True))}
+        elif orjson is not None:
+            with open(json_path, 'rb') as file:
+                data = orjson.loads(file.read())
+        else:
+            # json detects UTF-8 from bytes itself, so skip decoding to str first
+            with open(json_path, 'rb') as file:
+                data = json.loads(file.read())
         
         total_mods = len(data.get('files', []))
         ColorPrinter.print(f"Found {total_mods} mods to process", Fore.CYAN)
         
         return data, total_mods
     
+    @staticmethod
+    def get_export_format():
+        """
+        Get the configured export format, falling back to CSV if it can't be written.
+        
+        Returns:
+            str: 'csv', 'json', 'parquet' or 'feather'
+        """
+        export_format = ConfigManager.get('export', 'default_format', default='csv')
+        # Parquet and Feather need pyarrow; find_spec checks for it without the import cost
+        if export_format in ('parquet', 'feather') and find_spec('pyarrow') is None:
+            ColorPrinter.print(f"pyarrow is not installed, so {export_format} export is unavailable. "
+                               "Saving as CSV instead.", Fore.YELLOW)
+            return 'csv'
+        return export_format
+    
     @classmethod
-    def save_filtered_list(cls, mods_df, filter_type="all"):
+    def save_filtered_list(cls, mods_df, filter_type="all", export_format=None):
         """
         Save filtered mod list to CSV with accurate counting in output folder.
         
         Args:
             mods_df (DataFrame): Pandas DataFrame with mod data.
             filter_type (str): Type of filtering to apply.
+            export_format (str, optional): Format from get_export_format; looked up if omitted.
+        """
+        side, filename = cls.EXPORT_LISTS[filter_type]
+        mods_filtered = mods_df if side is None else mods_df[mods_df['Side'] == side]
+        cls._write_mod_list(mods_filtered, filename, export_format or cls.get_export_format())
+    
+    @classmethod
+    def save_all_filtered(cls, mods_df, export_format=None):
+        """
+        Save the full mod list and every side-specific list in a single pass.
+        
+        Args:
+            mods_df (DataFrame): Pandas DataFrame with mod data.
+            export_format (str, optional): Format from get_export_format; looked up if omitted.
+        """
+        export_format = export_format or cls.get_export_format()
+        # Partition by side once instead of masking the whole frame per list
+        groups = dict(list(mods_df.groupby('Side', observed=True)))
+        empty = mods_df.iloc[0:0]
+        
+        for side, filename in cls.EXPORT_LISTS.values():
+            cls._write_mod_list(mods_df if side is None else groups.get(side, empty), filename, export_format)
+    
+    @classmethod
+    def _write_mod_list(cls, mods_filtered, filename, export_format):
         """
-        if filter_type == "all":
-            filename = "Lista_Mods_Com_Ambiente.csv"
-            mods_filtered = mods_df
-        elif filter_type == "client":
-            filename = "Lista_Mods_Client.csv"
-            # Only include strictly client-side mods
-            mods_filtered = mods_df[mods_df['Side'] == 'Client']
-        elif filter_type == "server":
-            filename = "Lista_Mods_Server.csv"
-            # Only include strictly server-side mods
-            mods_filtered = mods_df[mods_df['Side'] == 'Server']
-        elif filter_type == "both":
-            filename = "Lista_Mods_Both.csv"
-            # Only include mods that work on both sides
-            mods_filtered = mods_df[mods_df['Side'] == 'Both']
+        Write a mod list in the given export format to the output folder.
+        
+        Args:
+            mods_filtered (DataFrame): Mods to write.
+            filename (str): Name of the CSV file; other formats swap the extension.
+            export_format (str): Format returned by get_export_format.
+        """
+        if export_format in ('json', 'parquet', 'feather'):
+            filename = f"{os.path.splitext(filename)[0]}.{export_format}"
         
         # Use output folder for saving files
         output_path = os.path.join(cls.OUTPUT_FOLDER, filename)
         
         # Save with proper encoding
-        mods_filtered.to_csv(output_path, index=False, encoding='utf-8')
+        if export_format == 'json':
+            mods_filtered.to_json(output_path, orient='records', force_ascii=False, indent=2)
+        elif export_format == 'parquet':
+            mods_filtered.to_parquet(output_path, index=False, compression='zstd')
+        elif export_format == 'feather':
+            # Feather only stores a default index
+            mods_filtered.reset_index(drop=True).to_feather(output_path)
+        else:
+            # Always pandas, so the CSV bytes don't depend on whether pyarrow is installed;
+            # write in chunks so the whole CSV text is never held in memory
+            mods_filtered.to_csv(output_path, index=False, encoding='utf-8', lineterminator='\n', chunksize=10_000)
         ColorPrinter.print(f"✓ Saved {len(mods_filtered)} mods to {filename}", Fore.GREEN)
-        ColorPrinter.print(f"File saved at: {os.path.abspath(output_path)}", Fore.CYAN)
+        ColorPrinter.print(f"File saved at: {output_path}", Fore.CYAN)
+    
+    @staticmethod
+    def write_missing_mods(path, title, mods_df, missing_mods):
+        """
+        Write a list of mods that need to be downloaded manually.
+        
+        Args:
+            path (str): Path of the text file to write
+            title (str): What the mods are missing from, e.g. 'SERVER-SIDE MODPACK'
+            mods_df (DataFrame): DataFrame with mod data, used to look up download URLs
+            missing_mods (list): Names of the missing mods, in the order to list them
+        """
+        # Map names to download URLs once instead of masking the frame per mod
+        url_map = dict(zip(mods_df['Name'].tolist(), mods_df['Download URL'].tolist()))
+        # Add the mod's download URL if available
+        mod_lines = "".join(
+            f"{mod} - {url_map[mod]}\n" if url_map.get(mod) else f"{mod}\n" for mod in missing_mods
+        )
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(
+                f"# Missing Mods for {title}\n"
+                f"# Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                f"# The following {len(missing_mods)} mods were not found locally and need to be downloaded manually:\n\n"
+                f"{mod_lines}"
+            )
     
     @classmethod
-    def create_modpack_zip(cls, mods_df, pack_type):
+    def create_modpack_zip(cls, mods_df, pack_type, jar_files=None):
         """
         Create a server-side or client-side modpack zip.
         
         Args:
             mods_df (DataFrame): DataFrame with mod data
             pack_type (str): Type of pack to create ('server' or 'client')
+            jar_files (list): Extracted jar names from list_jars, listed here if not given
             
         Returns:
             str: Path to the created zip file
@@ -246,122 +443,99 @@ class FileManager:
         # Path to the extracted mods directory
         mods_dir = os.path.join(cls.TEMP_FOLDER, 'mods')
         
-        # Track which mods were found and included
-        included_mods = []
-        missing_mods = []
+        # Index the extracted jars once instead of scanning them per mod
+        if jar_files is None:
+            jar_files = cls.list_jars()
+        jar_set = set(jar_files)
+        # Sorted so the jars starting with a given prefix can be found by bisection
+        sorted_jars = sorted(jar_files)
         
-        # Create a temporary directory for organizing the pack
-        pack_temp_dir = os.path.join(cls.TEMP_FOLDER, f"{pack_type}_pack")
-        pack_mods_dir = os.path.join(pack_temp_dir, "mods")
-        os.makedirs(pack_mods_dir, exist_ok=True)
+        def resolve_jar(mod_name, mod_base_name):
+            # Try different ways the mod might be named in the extracted files
+            if mod_name in jar_set:  # Exact name from index
+                return mod_name
+            if mod_name.lower() in jar_set:  # Lowercase variant
+                return mod_name.lower()
+            # Also accept any jar file that starts with the mod name (without version)
+            index = bisect.bisect_left(sorted_jars, mod_base_name)
+            if index < len(sorted_jars) and sorted_jars[index].startswith(mod_base_name):
+                return sorted_jars[index]
+            return None
         
-        # Create a progress bar for the modpack creation
-        from tqdm import tqdm
-        with tqdm(total=len(mods_filtered), desc=f"Building {pack_type} pack", 
-                  bar_format='  {desc}: |{bar}| {percentage:3.0f}% [{n_fmt}/{total_fmt}]',
-                  colour='green') as pbar:
-            
-            # Copy the appropriate mods
-            if os.path.exists(mods_dir):
-                for _, mod_row in mods_filtered.iterrows():
-                    mod_name = mod_row['Name']
-                    
-                    # Try different ways the mod might be named in the extracted files
-                    possible_filenames = [
-                        mod_name,  # Exact name from index
-                        mod_name.lower(),  # Lowercase variant
-                    ]
-                    
-                    # Also add any jar files that start with the mod name (without version)
-                    mod_base_name = mod_name.split('-')[0] if '-' in mod_name else mod_name.split('.jar')[0]
-                    
-                    found = False
-                    for jar_file in os.listdir(mods_dir):
-                        # Check for exact matches
-                        if jar_file in possible_filenames:
-                            shutil.copy2(os.path.join(mods_dir, jar_file), os.path.join(pack_mods_dir, jar_file))
-                            included_mods.append(jar_file)
-                            found = True
-                            break
-                        # Check for files that start with the mod_base_name
-                        elif jar_file.startswith(mod_base_name) and jar_file.endswith('.jar'):
-                            shutil.copy2(os.path.join(mods_dir, jar_file), os.path.join(pack_mods_dir, jar_file))
-                            included_mods.append(jar_file)
-                            found = True
-                            break
-                    
-                    if not found:
-                        missing_mods.append(mod_name)
+        # Resolve every mod up front, then split into found and missing in one step
+        mod_names = mods_filtered['Name']
+        # Base names (text before the first '-', or before '.jar' if there is none) for every mod at once
+        base_names = mod_names.str.split('-', n=1).str[0].where(
+            mod_names.str.contains('-', regex=False),
+            mod_names.str.split('.jar', n=1, regex=False).str[0]
+        )
+        resolved = mod_names.combine(base_names, resolve_jar)
+        found = resolved.notna()
+        included_mods = resolved[found].tolist()
+        missing_mods = mod_names[~found].tolist()
+        
+        # Two mods can resolve to the same jar; store it only once
+        jars_to_write = list(dict.fromkeys(included_mods))
+        mods_prefix = mods_dir + os.sep
+        
+        # Create the final zip file and write every jar straight into it, with no staging copy
+        # Jars are already deflated, so store them as-is; only the text files below are compressed
+        with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as zip_out:
+            # Create a progress bar for the modpack creation
+            from tqdm import tqdm
+            with tqdm(total=len(jars_to_write), desc=f"Building {pack_type} pack", 
+                      bar_format='  {desc}: |{bar}| {percentage:3.0f}% [{n_fmt}/{total_fmt}]',
+                      colour='green') as pbar:
+                
+                # Add the appropriate mods
+                for jar_file in jars_to_write:
+                    zip_out.write(mods_prefix + jar_file, f"mods/{jar_file}")
                     
                     # Update progress bar
                     pbar.update(1)
-        
-        # Create a report file
-        report_path = os.path.join(pack_temp_dir, "modpack_report.txt")
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(f"{pack_type.upper()}-SIDE MODPACK REPORT\n")
-            f.write(f"Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"Total mods included: {len(included_mods)}\n")
-            f.write(f"Mods not found: {len(missing_mods)}\n\n")
             
-            f.write("Side requirements:\n")
-            for side, count in mods_filtered['Side'].value_counts().items():
-                f.write(f"- {side}: {count}\n")
+            # Create a report file
+            # Categorical counts include sides filtered out of this pack, so skip zero counts
+            side_lines = "".join(
+                f"- {side}: {count}\n" for side, count in mods_filtered['Side'].value_counts().items() if count
+            )
+            included_lines = "".join(f"- {mod}\n" for mod in included_mods)
+            missing_section = (
+                "\nMISSING MODS:\n" + "".join(f"- {mod}\n" for mod in missing_mods) if missing_mods else ""
+            )
+            report_text = (
+                f"{pack_type.upper()}-SIDE MODPACK REPORT\n"
+                f"Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                f"Total mods included: {len(included_mods)}\n"
+                f"Mods not found: {len(missing_mods)}\n\n"
+                f"Side requirements:\n{side_lines}"
+                f"\nINCLUDED MODS:\n{included_lines}"
+                f"{missing_section}"
+            )
+            zip_out.writestr("modpack_report.txt", report_text, compress_type=zipfile.ZIP_DEFLATED)
             
-            f.write("\nINCLUDED MODS:\n")
-            for mod in included_mods:
-                f.write(f"- {mod}\n")
-            
-            if missing_mods:
-                f.write("\nMISSING MODS:\n")
-                for mod in missing_mods:
-                    f.write(f"- {mod}\n")
+            # Create a README file
+            readme_text = (
+                f"# {pack_type.title()}-Side Modpack\n\n"
+                f"This modpack was automatically generated by the Mod Side Checker tool.\n"
+                f"It contains {len(included_mods)} mods that are required for the {pack_type} side.\n\n"
+                f"## Installation\n\n"
+                f"1. Extract the contents of this ZIP file\n"
+                f"2. Place the mods folder in your Minecraft {pack_type} directory\n\n"
+                f"## Side Requirements\n\n"
+                f"This pack includes the following mod types:\n"
+                f"- Both sides: Mods required on both client and server\n"
+                f"- {pack_type.title()}-only: Mods that only need to be installed on the {pack_type}\n"
+            )
+            zip_out.writestr("README.md", readme_text, compress_type=zipfile.ZIP_DEFLATED)
         
         # Also create a missing mods file in the output folder
         if missing_mods:
             missing_mods_path = os.path.join(cls.OUTPUT_FOLDER, f"{pack_type}_missing_mods.txt")
-            with open(missing_mods_path, 'w', encoding='utf-8') as f:
-                f.write(f"# Missing Mods for {pack_type.upper()}-SIDE MODPACK\n")
-                f.write(f"# Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write(f"# The following {len(missing_mods)} mods were not found locally and need to be downloaded manually:\n\n")
-                
-                for mod in missing_mods:
-                    # Find the mod's download URL if available
-                    mod_info = mods_df[mods_df['Name'] == mod]
-                    if not mod_info.empty:
-                        download_url = mod_info.iloc[0]['Download URL']
-                        f.write(f"{mod} - {download_url}\n")
-                    else:
-                        f.write(f"{mod}\n")
+            cls.write_missing_mods(missing_mods_path, f"{pack_type.upper()}-SIDE MODPACK", mods_df, missing_mods)
             
             ColorPrinter.print(f"  Created list of {len(missing_mods)} missing mods: {os.path.basename(missing_mods_path)}", Fore.YELLOW)
         
-        # Create a README file
-        readme_path = os.path.join(pack_temp_dir, "README.md")
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(f"# {pack_type.title()}-Side Modpack\n\n")
-            f.write(f"This modpack was automatically generated by the Mod Side Checker tool.\n")
-            f.write(f"It contains {len(included_mods)} mods that are required for the {pack_type} side.\n\n")
-            
-            f.write("## Installation\n\n")
-            f.write("1. Extract the contents of this ZIP file\n")
-            f.write(f"2. Place the mods folder in your Minecraft {pack_type} directory\n\n")
-            
-            f.write("## Side Requirements\n\n")
-            f.write("This pack includes the following mod types:\n")
-            f.write("- Both sides: Mods required on both client and server\n")
-            f.write(f"- {pack_type.title()}-only: Mods that only need to be installed on the {pack_type}\n")
-        
-        # Create the final zip file
-        with zipfile.ZipFile(output_path, 'w') as zip_out:
-            # Add all files from the pack_temp_dir
-            for root, _, files in os.walk(pack_temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    # Add the file with appropriate internal path
-                    arcname = os.path.relpath(file_path, pack_temp_dir)
-                    zip_out.write(file_path, arcname)
-        
         # Print results
         if included_mods:
             ColorPrinter.print(f"✓ Created {pack_type}-side modpack with {len(included_mods)} mods", Fore.GREEN)
@@ -371,6 +545,6 @@ class FileManager:
         if missing_mods:
             ColorPrinter.print(f"  Note: {len(missing_mods)} mods were not found locally", Fore.YELLOW)
             
-        ColorPrinter.print(f"File saved at: {os.path.abspath(output_path)}", Fore.CYAN)
+        ColorPrinter.print(f"File saved at: {output_path}", Fore.CYAN)
         
         return output_path
\ No newline at end of file
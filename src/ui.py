@@ -1,27 +1,17 @@
 """
 User interface elements for the Mod Side Checker.
 """
+import sys
+from collections import Counter
 from colorama import Fore, Style
 
-# Try relative import first, fall back to absolute import if needed
-try:
-    from .utils import ColorPrinter
-    from .config_manager import ConfigManager
-except ImportError:
-    import sys
-    import os.path
-    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-    from src.utils import ColorPrinter
-    from src.config_manager import ConfigManager
+from .utils import ColorPrinter
+from .config_manager import ConfigManager
+from .file_manager import FileManager
 
 
-class UserInterface:
-    """Class for user interface elements."""
-    
-    @staticmethod
-    def print_header():
-        """Print the application header."""
-        ascii_art = """
+# Header art, colored and encoded once at import
+_ASCII_ART = """
 ███╗   ███╗ ██████╗ ██████╗ ██████╗ ██╗███╗   ██╗████████╗██╗  ██╗    ████████╗ ██████╗  ██████╗ ██╗     ███████╗
 ████╗ ████║██╔═══██╗██╔══██╗██╔══██╗██║████╗  ██║╚══██╔══╝██║  ██║    ╚══██╔══╝██╔═══██╗██╔═══██╗██║     ██╔════╝
 ██╔████╔██║██║   ██║██║  ██║██████╔╝██║██╔██╗ ██║   ██║   ███████║       ██║   ██║   ██║██║   ██║██║     ███████╗
@@ -30,28 +20,103 @@ class UserInterface:
 ╚═╝     ╚═╝ ╚═════╝ ╚═════╝ ╚═╝  ╚═╝╚═╝╚═╝  ╚═══╝   ╚═╝   ╚═╝  ╚═╝       ╚═╝    ╚═════╝  ╚═════╝ ╚══════╝╚══════╝
                                                                                                                  
         """
-        ColorPrinter.print(ascii_art, Fore.BLUE)
+_HEADER = f"{Fore.BLUE}{_ASCII_ART}{Style.RESET_ALL}\n"
+_HEADER_BYTES = _HEADER.encode('utf-8')
+
+# Menus never change, so compose each one once instead of printing it line by line
+_MODE_MENU = (
+    f"{Fore.CYAN}"
+    "\n╭─── Select Mode ─────────────╮\n"
+    "│ 1. Mod Side Checker        │\n"
+    "│ 2. Modpack Creator         │\n"
+    "╰────────────────────────────╯\n"
+    f"{Style.RESET_ALL}"
+)
 
+_EXPORT_MENU = (
+    f"{Fore.CYAN}"
+    "\n╭─── Export Options ─────────╮\n"
+    "│ 1. Export all mods\n"
+    "│ 2. Export client-only mods\n"
+    "│ 3. Export server-only mods\n"
+    "│ 4. Export mods for both sides\n"
+    "│ 5. Export all types separately\n"
+    "│ 6. Exit\n"
+    "╰────────────────────────────╯\n"
+    f"{Style.RESET_ALL}"
+)
+
+_MODPACK_MENU = (
+    f"{Fore.CYAN}"
+    "\n╭─── Modpack Creator Options ───╮\n"
+    "│ 1. Create server-side pack    │\n"
+    "│ 2. Create client-side pack    │\n"
+    "│ 3. Create both packs          │\n"
+    "│ 4. Return to main menu        │\n"
+    "╰────────────────────────────────╯\n"
+    f"{Style.RESET_ALL}"
+)
+
+# Valid answers for each menu
+_MODE_CHOICES = frozenset("12")
+_EXPORT_CHOICES = frozenset("123456")
+_MODPACK_CHOICES = frozenset("1234")
+
+
+def _make_menu(menu, choices, choice_range, invalid_message, doc):
+    """
+    Build a function that shows a menu until the user enters one of its choices.
+    
+    Args:
+        menu (str): Pre-composed menu text
+        choices (frozenset): Valid answers
+        choice_range (str): Range shown in the prompt, e.g. '1-4'
+        invalid_message (str): Message shown after an invalid answer
+        doc (str): Docstring for the built function
+        
+    Returns:
+        function: Function returning the user's choice
+    """
+    prompt = f"{Fore.CYAN}\nEnter your choice ({choice_range}): {Style.RESET_ALL}"
+    
+    def get_choice():
+        while True:
+            sys.stdout.write(menu)
+            
+            choice = ColorPrinter.input(prompt)
+            
+            if choice in choices:
+                return choice
+            
+            ColorPrinter.yellow(invalid_message)
+    
+    get_choice.__doc__ = doc
+    return get_choice
+
+
+class UserInterface:
+    """Class for user interface elements."""
+    
     @staticmethod
-    def get_application_mode():
+    def print_header():
+        """Print the application header."""
+        # Hand the pre-encoded bytes straight to the buffer unless colorama needs to see the text
+        if sys.stdout is sys.__stdout__ and (sys.stdout.encoding or '').lower().replace('-', '') == 'utf8':
+            sys.stdout.flush()
+            sys.stdout.buffer.write(_HEADER_BYTES)
+            sys.stdout.buffer.flush()
+        else:
+            sys.stdout.write(_HEADER)
+
+    get_application_mode = staticmethod(_make_menu(
+        _MODE_MENU, _MODE_CHOICES, "1-2", "→ Please enter a valid option (1-2)",
         """
         Get the application mode from user.
         
         Returns:
             str: Selected mode ('1' for Checker, '2' for Modpack Creator)
         """
-        while True:
-            ColorPrinter.print("\n╭─── Select Mode ─────────────╮", Fore.CYAN)
-            ColorPrinter.print("│ 1. Mod Side Checker        │", Fore.CYAN)
-            ColorPrinter.print("│ 2. Modpack Creator         │", Fore.CYAN)
-            ColorPrinter.print("╰────────────────────────────╯", Fore.CYAN)
-            
-            choice = input(f"{Fore.CYAN}\nEnter your choice (1-2): {Style.RESET_ALL}")
-            
-            if choice in ["1", "2"]:
-                return choice
-            
-            ColorPrinter.print("→ Please enter a valid option (1-2)", Fore.YELLOW)
+    ))
 
     @staticmethod
     def get_thread_count():
@@ -66,21 +131,26 @@ class UserInterface:
         recommended_max = ConfigManager.get('threading', 'recommended_max', default=6)
         warning = ConfigManager.get('threading', 'warning', default='')
         
+        # Build the parts of the prompt that don't change between retries once
+        recommended_line = f"│ Recommended max: {recommended_max}        │"
+        warning_line = f"│ {warning[:30]}... │" if warning else None
+        prompt = f"{Fore.CYAN}│ Number of threads (1-{max_allowed}): {Style.RESET_ALL}"
+        
         while True:
             try:
-                ColorPrinter.print("\n╭─── Thread Configuration ────╮", Fore.CYAN)
-                ColorPrinter.print(f"│ Recommended max: {recommended_max}        │", Fore.CYAN)
-                if warning:
-                    ColorPrinter.print(f"│ {warning[:30]}... │", Fore.YELLOW)
-                max_threads = int(input(f"{Fore.CYAN}│ Number of threads (1-{max_allowed}): {Style.RESET_ALL}"))
+                ColorPrinter.cyan("\n╭─── Thread Configuration ────╮")
+                ColorPrinter.cyan(recommended_line)
+                if warning_line:
+                    ColorPrinter.yellow(warning_line)
+                max_threads = int(ColorPrinter.input(prompt))
                 if 1 <= max_threads <= max_allowed:
                     if max_threads > recommended_max:
-                        ColorPrinter.print(f"│ Note: Using {max_threads} threads may affect UI stability", Fore.YELLOW)
-                    ColorPrinter.print("╰──────────────────────────╯", Fore.CYAN)
+                        ColorPrinter.yellow(f"│ Note: Using {max_threads} threads may affect UI stability")
+                    ColorPrinter.cyan("╰──────────────────────────╯")
                     return max_threads
-                ColorPrinter.print(f"→ Please enter a number between 1 and {max_allowed}", Fore.YELLOW)
+                ColorPrinter.yellow(f"→ Please enter a number between 1 and {max_allowed}")
             except ValueError:
-                ColorPrinter.print("→ Please enter a valid number", Fore.YELLOW)
+                ColorPrinter.yellow("→ Please enter a valid number")
 
     @staticmethod
     def print_summary(mods_df):
@@ -90,57 +160,67 @@ class UserInterface:
         Args:
             mods_df (DataFrame): DataFrame containing mod data
         """
-        ColorPrinter.print("\n╭─── Summary ───────────────╮", Fore.CYAN)
-        ColorPrinter.print(f"│ Total mods: {len(mods_df)}", Fore.CYAN)
-        ColorPrinter.print("│ Distribution:", Fore.CYAN)
-        for side, count in mods_df['Side'].value_counts().items():
-            ColorPrinter.print(f"│ • {side}: {count}", Fore.CYAN)
-        ColorPrinter.print("╰────────────────────────────╯", Fore.CYAN)
+        # Counter beats value_counts on a handful of values, and skips categories with no mods
+        sides = mods_df['Side'].to_numpy().tolist()
+        counts = Counter(sides)
+        
+        distribution = "".join(f"│ • {side}: {count}\n" for side, count in counts.most_common())
+        
+        # Emit the whole box in one write
+        sys.stdout.write(
+            f"{Fore.CYAN}"
+            "\n╭─── Summary ───────────────╮\n"
+            f"│ Total mods: {len(sides)}\n"
+            "│ Distribution:\n"
+            f"{distribution}"
+            "╰────────────────────────────╯\n"
+            f"{Style.RESET_ALL}"
+        )
 
-    @staticmethod
-    def get_export_choice():
+    get_export_choice = staticmethod(_make_menu(
+        _EXPORT_MENU, _EXPORT_CHOICES, "1-6", "\nInvalid choice. Please try again.",
         """
         Get export option from user.
         
         Returns:
             str: User's choice ('1'-'6')
         """
+    ))
+
+    @staticmethod
+    def handle_export(mods_df):
+        """
+        Show the export menu and save the chosen lists until the user exits.
+        
+        Args:
+            mods_df (DataFrame): DataFrame containing mod data
+        """
+        # Settle the format before the menu so a missing dependency is reported once, not mid-export
+        export_format = FileManager.get_export_format()
+        
         while True:
-            ColorPrinter.print("\n╭─── Export Options ─────────╮", Fore.CYAN)
-            ColorPrinter.print("│ 1. Export all mods", Fore.CYAN)
-            ColorPrinter.print("│ 2. Export client-only mods", Fore.CYAN)
-            ColorPrinter.print("│ 3. Export server-only mods", Fore.CYAN)
-            ColorPrinter.print("│ 4. Export mods for both sides", Fore.CYAN)
-            ColorPrinter.print("│ 5. Export all types separately", Fore.CYAN)
-            ColorPrinter.print("│ 6. Exit", Fore.CYAN)
-            ColorPrinter.print("╰────────────────────────────╯", Fore.CYAN)
-            
-            choice = input(f"{Fore.CYAN}\nEnter your choice (1-6): {Style.RESET_ALL}")
-            
-            if choice in ["1", "2", "3", "4", "5", "6"]:
-                return choice
+            choice = UserInterface.get_export_choice()
             
-            ColorPrinter.print("\nInvalid choice. Please try again.", Fore.YELLOW)
+            if choice == '1':
+                FileManager.save_filtered_list(mods_df, "all", export_format)
+            elif choice == '2':
+                FileManager.save_filtered_list(mods_df, "client", export_format)
+            elif choice == '3':
+                FileManager.save_filtered_list(mods_df, "server", export_format)
+            elif choice == '4':
+                FileManager.save_filtered_list(mods_df, "both", export_format)
+            elif choice == '5':
+                FileManager.save_all_filtered(mods_df, export_format)
+            elif choice == '6':
+                ColorPrinter.green("\nReturning to main menu...")
+                break
 
-    @staticmethod
-    def get_modpack_choice():
+    get_modpack_choice = staticmethod(_make_menu(
+        _MODPACK_MENU, _MODPACK_CHOICES, "1-4", "\nInvalid choice. Please try again.",
         """
         Get modpack creator option from user.
         
         Returns:
             str: User's choice ('1'-'4')
         """
-        while True:
-            ColorPrinter.print("\n╭─── Modpack Creator Options ───╮", Fore.CYAN)
-            ColorPrinter.print("│ 1. Create server-side pack    │", Fore.CYAN)
-            ColorPrinter.print("│ 2. Create client-side pack    │", Fore.CYAN)
-            ColorPrinter.print("│ 3. Create both packs          │", Fore.CYAN)
-            ColorPrinter.print("│ 4. Return to main menu        │", Fore.CYAN)
-            ColorPrinter.print("╰────────────────────────────────╯", Fore.CYAN)
-            
-            choice = input(f"{Fore.CYAN}\nEnter your choice (1-4): {Style.RESET_ALL}")
-            
-            if choice in ["1", "2", "3", "4"]:
-                return choice
-            
-            ColorPrinter.print("\nInvalid choice. Please try again.", Fore.YELLOW)
+    ))
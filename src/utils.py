@@ -1,12 +1,21 @@
 """
 Utility functions for the Mod Side Checker.
 """
+import os
 import sys
+import time
 import signal
+import threading
 from colorama import init, Fore, Style
 
-# Initialize colorama
-init()
+# POSIX terminals understand ANSI codes natively, so only wrap stdout on Windows, where
+# colorama translates them, or when output is piped, where it strips them so files stay
+# plain text. Either way autoreset appends the reset code to every write for us
+if sys.platform == "win32" or not sys.stdout.isatty():
+    init(autoreset=True)
+    _RESET = ""
+else:
+    _RESET = Style.RESET_ALL
 
 class ColorPrinter:
     """Class for printing colored text."""
@@ -21,12 +30,63 @@ class ColorPrinter:
             color (colorama.Fore): Color to use
             end (str): String appended after the last value, default is newline
         """
-        print(f"{color}{text}{Style.RESET_ALL}", end=end)
+        print(f"{color}{text}{_RESET}", end=end)
+    
+    @staticmethod
+    def cyan(text):
+        """
+        Print a line in cyan, the color used for menus and information.
+        
+        Args:
+            text (str): Text to print
+        """
+        sys.stdout.write(f"{Fore.CYAN}{text}{_RESET}\n")
+    
+    @staticmethod
+    def yellow(text):
+        """
+        Print a line in yellow, the color used for warnings and invalid input.
+        
+        Args:
+            text (str): Text to print
+        """
+        sys.stdout.write(f"{Fore.YELLOW}{text}{_RESET}\n")
+    
+    @staticmethod
+    def green(text):
+        """
+        Print a line in green, the color used for success messages.
+        
+        Args:
+            text (str): Text to print
+        """
+        sys.stdout.write(f"{Fore.GREEN}{text}{_RESET}\n")
+    
+    @staticmethod
+    def input(prompt=''):
+        """
+        Read a line from the user, like input() but without going through readline.
+        
+        Args:
+            prompt (str): Text to show before reading
+            
+        Returns:
+            str: The line entered, without its line ending
+        """
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\r\n')
 
 
 class SignalHandler:
     """Class for handling system signals."""
     
+    # Plain ASCII so it reads correctly on any console without colorama translating it
+    EXIT_MESSAGE = b"\nCaught interrupt signal. Goodbye!\n"
+    
     @staticmethod
     def clean_exit(sig=None, frame=None):
         """
@@ -36,11 +96,80 @@ class SignalHandler:
             sig: Signal number
             frame: Current stack frame
         """
-        ColorPrinter.print("\n⚠️  Caught interrupt signal. Cleaning up...", Fore.YELLOW)
-        ColorPrinter.print("✓ Cleanup complete. Goodbye!", Fore.GREEN)
-        sys.exit(0)
+        # Write straight to the stderr descriptor and exit at once; print() and the
+        # colorama wrapper aren't safe to re-enter from a signal handler
+        os.write(2, SignalHandler.EXIT_MESSAGE)
+        os._exit(0)
     
     @staticmethod
     def setup_signal_handling():
         """Set up signal handlers for the application."""
         signal.signal(signal.SIGINT, SignalHandler.clean_exit)
+
+
+class TokenBucket:
+    """Class for rate limiting an action shared between threads."""
+    
+    STOP_POLL_INTERVAL = 0.5  # Longest wait between stop_event checks in acquire
+    
+    def __init__(self, rate, capacity):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate (float): Tokens added per second
+            capacity (int): Maximum number of tokens, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.condition = threading.Condition()
+    
+    def _refill(self):
+        """Add the tokens earned since the last update. Call with the lock held."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    def acquire(self, stop_event=None):
+        """
+        Block until a token is available, then take it.
+        
+        Args:
+            stop_event (threading.Event, optional): Give up waiting once this is set
+            
+        Returns:
+            bool: True if a token was taken, False if stop_event was set first
+        """
+        with self.condition:
+            while True:
+                if stop_event is not None and stop_event.is_set():
+                    return False
+                
+                self._refill()
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                
+                # Sleep until the next token is due; waiting releases the lock for other threads
+                wait = (1 - self.tokens) / self.rate
+                if stop_event is not None:
+                    # Wake up regularly so a long pause can't outlive an interrupt
+                    wait = min(wait, self.STOP_POLL_INTERVAL)
+                self.condition.wait(wait)
+    
+    def pause(self, seconds):
+        """
+        Withhold tokens from every thread for a number of seconds.
+        
+        Args:
+            seconds (float): How long to hold back new tokens
+        """
+        with self.condition:
+            # Settle the refill up to now first, so time before the pause isn't counted against it
+            self._refill()
+            # A negative balance takes exactly this long to refill back to zero; concurrent
+            # pauses overlap instead of adding up
+            self.tokens = min(self.tokens, -seconds * self.rate)
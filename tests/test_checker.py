@@ -0,0 +1,69 @@
+"""
+Tests for the mod environment checker.
+"""
+import io
+import threading
+import unittest
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from src.checker import ModChecker
+
+
+class RateLimitingHandler(BaseHTTPRequestHandler):
+    """Answers the first request with a 429 and Retry-After, then with one project."""
+    
+    hits = 0
+    
+    def do_GET(self):
+        type(self).hits += 1
+        if type(self).hits == 1:
+            self.send_response(429)
+            self.send_header('Retry-After', '2')
+            body = b''
+        else:
+            self.send_response(200)
+            body = b'[{"id": "abc", "client_side": "required", "server_side": "unsupported"}]'
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class FetchEnvironmentChunkTest(unittest.TestCase):
+    """Tests for ModChecker.fetch_environment_chunk."""
+    
+    def setUp(self):
+        RateLimitingHandler.hits = 0
+        server = ThreadingHTTPServer(('127.0.0.1', 0), RateLimitingHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        
+        url = f"http://127.0.0.1:{server.server_address[1]}/v2/projects"
+        patcher = mock.patch.object(ModChecker, 'PROJECTS_API_URL', url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.checker = ModChecker()
+        # Route the test server through the same retrying adapter as the API
+        session = self.checker.session
+        session.mount("http://", session.get_adapter("https://"))
+        self.addCleanup(session.close)
+    
+    def test_rate_limit_with_retry_after_is_waited_out_interruptibly(self):
+        with mock.patch.object(self.checker.stop_event, 'wait', return_value=False) as wait, \
+                redirect_stdout(io.StringIO()):
+            env_map = self.checker.fetch_environment_chunk(['abc'])
+        
+        # The adapter must hand the 429 back instead of sleeping through it itself
+        wait.assert_called_once_with(2)
+        self.assertEqual(RateLimitingHandler.hits, 2)
+        self.assertEqual(env_map, {'abc': ('required', 'unsupported')})
+
+
+if __name__ == '__main__':
+    unittest.main()
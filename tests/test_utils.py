@@ -0,0 +1,94 @@
+"""
+Tests for the utility classes of the Mod Side Checker.
+"""
+import threading
+import unittest
+from unittest import mock
+
+from src.utils import TokenBucket
+
+
+class FakeClock:
+    """Clock that only moves when told to, standing in for time.monotonic."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class FakeCondition:
+    """Condition whose wait advances the fake clock instead of sleeping."""
+    
+    def __init__(self, clock):
+        self.clock = clock
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def wait(self, timeout):
+        self.clock.now += timeout
+
+
+class TokenBucketPauseTest(unittest.TestCase):
+    """Tests for TokenBucket.pause."""
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('src.utils.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.bucket = TokenBucket(rate=1, capacity=1)
+        self.bucket.condition = FakeCondition(self.clock)
+    
+    def test_idle_time_before_pause_does_not_shorten_it(self):
+        self.bucket.acquire()
+        self.clock.now = 2.0
+        self.bucket.pause(2)
+        
+        self.bucket.acquire()
+        
+        self.assertGreaterEqual(self.clock.now, 4.0)
+    
+    def test_concurrent_pauses_do_not_add_up(self):
+        self.bucket.acquire()
+        for _ in range(3):
+            self.bucket.pause(1)
+        
+        self.bucket.acquire()
+        
+        # One pause of a second, then a second for the next token
+        self.assertAlmostEqual(self.clock.now, 2.0)
+    
+    def test_acquire_gives_up_once_stopped(self):
+        stop_event = threading.Event()
+        self.bucket.acquire()
+        self.bucket.pause(60)
+        stop_event.set()
+        
+        self.assertFalse(self.bucket.acquire(stop_event))
+        self.assertEqual(self.clock.now, 0.0)
+    
+    def test_acquire_checks_stop_event_during_pause(self):
+        stop_event = threading.Event()
+        self.bucket.acquire()
+        self.bucket.pause(60)
+        fake_wait = self.bucket.condition.wait
+        
+        def wait_then_stop(timeout):
+            fake_wait(timeout)
+            stop_event.set()
+        
+        self.bucket.condition.wait = wait_then_stop
+        
+        self.assertFalse(self.bucket.acquire(stop_event))
+        self.assertLessEqual(self.clock.now, TokenBucket.STOP_POLL_INTERVAL)
+
+
+if __name__ == '__main__':
+    unittest.main()